@@ -3,8 +3,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import random
-import time
+from collections import deque
 from datetime import datetime, timedelta
 import numpy as np
 
@@ -48,10 +47,13 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
-if 'cells_data' not in st.session_state:
-    st.session_state.cells_data = {}
-if 'historical_data' not in st.session_state:
-    st.session_state.historical_data = []
+if 'cells_df' not in st.session_state:
+    st.session_state.cells_df = pd.DataFrame()
+if 'history_blocks' not in st.session_state:
+    # Ring buffer of per-snapshot row blocks; the oldest drops off in O(1)
+    st.session_state.history_blocks = deque(maxlen=100)
+if 'history_version' not in st.session_state:
+    st.session_state.history_version = 0
 if 'is_monitoring' not in st.session_state:
     st.session_state.is_monitoring = False
 
@@ -83,54 +85,134 @@ CELL_CONFIGS = {
     }
 }
 
-def generate_cell_data(cell_type, cell_id, current_time):
-    """Generate realistic battery cell data"""
-    config = CELL_CONFIGS[cell_type]
-    
-    # Simulate realistic voltage fluctuations
-    base_voltage = config["nominal_voltage"]
-    voltage_variation = random.uniform(-0.1, 0.1)
-    voltage = round(base_voltage + voltage_variation, 3)
-    
-    # Simulate current (positive for charging, negative for discharging)
-    current = round(random.uniform(-5.0, 5.0), 2)
-    
-    # Temperature simulation with some correlation to current
-    base_temp = 25
-    temp_variation = abs(current) * 0.5 + random.uniform(-2, 8)
-    temperature = round(base_temp + temp_variation, 1)
-    
-    # Calculate power and capacity
-    power = round(voltage * abs(current), 2)
-    capacity = round(random.uniform(2.8, 3.2), 2)  # Ah
-    
-    # Health calculation based on voltage and temperature
-    voltage_health = 100 * (1 - abs(voltage - config["nominal_voltage"]) / config["nominal_voltage"])
-    temp_health = 100 * max(0, 1 - max(0, temperature - 35) / 20)
-    overall_health = round((voltage_health + temp_health) / 2, 1)
-    
-    # Status determination
-    if voltage < config["min_voltage"] or voltage > config["max_voltage"] or temperature > 45:
-        status = "Critical"
-    elif temperature > 40 or overall_health < 80:
-        status = "Warning"
-    else:
-        status = "Good"
-    
-    return {
-        "cell_id": cell_id,
-        "cell_type": cell_type,
+# Static lookups derived from the configs once at import
+CELL_COLOR_MAP = {cell_type: config["color"] for cell_type, config in CELL_CONFIGS.items()}
+VOLTAGE_BOUNDS = {
+    cell_type: (config["min_voltage"], config["max_voltage"])
+    for cell_type, config in CELL_CONFIGS.items()
+}
+
+# Shared random generator for all simulated readings
+_RNG = np.random.default_rng()
+
+def _cell_metrics_kernel(nominal, voltage_var, current, temp_var):
+    """Derive per-cell readings from the raw random draws in one fused loop"""
+    n = nominal.shape[0]
+    voltage = np.empty(n)
+    temperature = np.empty(n)
+    power = np.empty(n)
+    health = np.empty(n)
+    for k in range(n):
+        # Voltage fluctuates around nominal; temperature correlates with current
+        v = round(nominal[k] + voltage_var[k], 3)
+        t = round(25.0 + abs(current[k]) * 0.5 + temp_var[k], 1)
+
+        # Health calculation based on voltage and temperature
+        voltage_health = 100.0 * (1.0 - abs(v - nominal[k]) / nominal[k])
+        temp_health = 100.0 * max(0.0, 1.0 - max(0.0, t - 35.0) / 20.0)
+
+        voltage[k] = v
+        temperature[k] = t
+        power[k] = round(v * abs(current[k]), 2)
+        health[k] = round((voltage_health + temp_health) / 2.0, 1)
+    return voltage, temperature, power, health
+
+# Compile the kernel when numba is installed; the plain-Python loop is the
+# fallback and is perfectly adequate for the 1-16 cell range
+try:
+    from numba import njit
+    _cell_metrics_kernel = njit(cache=True, fastmath=True)(_cell_metrics_kernel)
+except ImportError:
+    pass
+
+def generate_cells_batch(cell_types, current_time):
+    """Generate realistic battery cell data for all cells in one vectorized pass"""
+    n = len(cell_types)
+    nominal = np.array([CELL_CONFIGS[t]["nominal_voltage"] for t in cell_types])
+    min_v = np.array([CELL_CONFIGS[t]["min_voltage"] for t in cell_types])
+    max_v = np.array([CELL_CONFIGS[t]["max_voltage"] for t in cell_types])
+
+    # One generator call covers all four simulated quantities, scaled to their
+    # ranges below; current is positive when charging, negative when discharging
+    draws = _RNG.uniform(size=(4, n))
+    voltage_var = draws[0] * 0.2 - 0.1           # [-0.1, 0.1)
+    current = np.round(draws[1] * 10.0 - 5.0, 2)  # [-5, 5)
+    temp_var = draws[2] * 10.0 - 2.0              # [-2, 8)
+    capacity = np.round(draws[3] * 0.4 + 2.8, 2)  # [2.8, 3.2) Ah
+
+    voltage, temperature, power, health = _cell_metrics_kernel(nominal, voltage_var, current, temp_var)
+
+    # Status determination: branchless integer codes, turned into labels only
+    # when the categorical column is built
+    critical = (voltage < min_v) | (voltage > max_v) | (temperature > 45)
+    warning = (temperature > 40) | (health < 80)
+    status_code = np.where(critical, 2, np.where(warning, 1, 0)).astype(np.int8)
+
+    return pd.DataFrame({
+        "cell_id": [f"Cell_{i+1}_{t}" for i, t in enumerate(cell_types)],
+        "cell_type": pd.Categorical(cell_types, categories=list(CELL_CONFIGS)),
         "voltage": voltage,
         "current": current,
         "temperature": temperature,
         "power": power,
         "capacity": capacity,
-        "health": overall_health,
-        "status": status,
-        "timestamp": current_time,
-        "min_voltage": config["min_voltage"],
-        "max_voltage": config["max_voltage"]
-    }
+        "health": health,
+        "status": pd.Categorical.from_codes(status_code, ["Good", "Warning", "Critical"]),
+        "timestamp": current_time
+    })
+
+@st.cache_data(max_entries=1)
+def get_history_frame(version):
+    """Long-format history of the last 50 snapshots for the trend charts.
+
+    Keyed on the history version counter so tab switches and widget
+    interactions on a paused dashboard reuse the cached frame.
+    """
+    return pd.concat(list(st.session_state.history_blocks)[-50:], ignore_index=True)
+
+@st.cache_data
+def get_heatmap_layout(cell_ids, cell_types):
+    """Row labels and row index per cell for the temperature heatmap.
+
+    The layout only changes when cells are re-initialized, so it is cached on
+    the (cell_ids, cell_types) tuples.
+    """
+    present = set(cell_types)
+    type_labels = [t for t in CELL_CONFIGS if t in present]
+    type_idx = np.array([type_labels.index(t) for t in cell_types])
+    return type_labels, type_idx
+
+def build_gauges_figure(cell_ids):
+    """Build one figure holding a health gauge per cell; values update in place"""
+    n_cols = min(len(cell_ids), 4)
+    n_rows = (len(cell_ids) + 3) // 4
+    fig = make_subplots(
+        rows=n_rows, cols=n_cols,
+        specs=[[{"type": "indicator"}] * n_cols for _ in range(n_rows)]
+    )
+    for i, cell_id in enumerate(cell_ids):
+        fig.add_trace(go.Indicator(
+            mode = "gauge+number+delta",
+            value = 0,
+            title = {'text': cell_id},
+            delta = {'reference': 100},
+            gauge = {
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "darkblue"},
+                'steps': [
+                    {'range': [0, 60], 'color': "lightgray"},
+                    {'range': [60, 80], 'color': "yellow"},
+                    {'range': [80, 100], 'color': "lightgreen"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            }
+        ), row=i // 4 + 1, col=i % 4 + 1)
+    fig.update_layout(height=250 * n_rows)
+    return fig
 
 def get_status_color(status):
     """Return color based on status"""
@@ -154,18 +236,22 @@ with st.sidebar:
     
     st.divider()
     
-    # Cell configuration
+    # Cell configuration. Kept in a form so the per-cell selectboxes are only
+    # reprocessed when the user applies a change, not on every widget interaction
     st.subheader("Cell Configuration")
-    num_cells = st.slider("Number of Cells", min_value=1, max_value=16, value=8)
-    
-    cell_types = []
-    for i in range(num_cells):
-        cell_type = st.selectbox(
-            f"Cell {i+1} Type",
-            options=list(CELL_CONFIGS.keys()),
-            key=f"cell_type_{i}"
-        )
-        cell_types.append(cell_type)
+    with st.form("cell_config"):
+        num_cells = st.slider("Number of Cells", min_value=1, max_value=16, value=8)
+
+        cell_types = []
+        for i in range(num_cells):
+            cell_type = st.selectbox(
+                f"Cell {i+1} Type",
+                options=list(CELL_CONFIGS.keys()),
+                key=f"cell_type_{i}"
+            )
+            cell_types.append(cell_type)
+
+        st.form_submit_button("Apply Configuration")
     
     st.divider()
     
@@ -174,10 +260,7 @@ with st.sidebar:
     
     if st.button("Initialize Cells", type="primary"):
         current_time = datetime.now()
-        st.session_state.cells_data = {}
-        for i, cell_type in enumerate(cell_types):
-            cell_id = f"Cell_{i+1}_{cell_type}"
-            st.session_state.cells_data[cell_id] = generate_cell_data(cell_type, cell_id, current_time)
+        st.session_state.cells_df = generate_cells_batch(cell_types, current_time)
         st.success("Cells initialized successfully!")
     
     # Monitoring controls
@@ -194,228 +277,209 @@ with st.sidebar:
     
     # Auto-refresh
     auto_refresh = st.checkbox("Auto Refresh (5s)", value=True)
-    
-    if auto_refresh and st.session_state.is_monitoring:
-        time.sleep(5)
-        st.rerun()
 
-# Main content area
-if st.session_state.cells_data:
-    
-    # Update data if monitoring
-    if st.session_state.is_monitoring:
-        current_time = datetime.now()
-        for cell_id in st.session_state.cells_data.keys():
-            cell_type = st.session_state.cells_data[cell_id]["cell_type"]
-            st.session_state.cells_data[cell_id] = generate_cell_data(cell_type, cell_id, current_time)
-        
-        # Store historical data
-        st.session_state.historical_data.append({
-            "timestamp": current_time,
-            "data": st.session_state.cells_data.copy()
-        })
-        
-        # Keep only last 100 records
-        if len(st.session_state.historical_data) > 100:
-            st.session_state.historical_data = st.session_state.historical_data[-100:]
-    
-    # System overview
-    st.header(f"📊 System Overview - {bench_name} (Group {group_num})")
-    
-    # Summary metrics
-    total_cells = len(st.session_state.cells_data)
-    good_cells = sum(1 for cell in st.session_state.cells_data.values() if cell["status"] == "Good")
-    warning_cells = sum(1 for cell in st.session_state.cells_data.values() if cell["status"] == "Warning")
-    critical_cells = sum(1 for cell in st.session_state.cells_data.values() if cell["status"] == "Critical")
-    avg_health = np.mean([cell["health"] for cell in st.session_state.cells_data.values()])
-    total_power = sum([cell["power"] for cell in st.session_state.cells_data.values()])
-    
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Total Cells", total_cells)
-    with col2:
-        st.metric("Good Cells", good_cells, delta=None)
-    with col3:
-        st.metric("Warning Cells", warning_cells, delta=None)
-    with col4:
-        st.metric("Critical Cells", critical_cells, delta=None)
-    with col5:
-        st.metric("Avg Health", f"{avg_health:.1f}%")
-    with col6:
-        st.metric("Total Power", f"{total_power:.2f}W")
-    
-    # Tabs for different views
-    tab1, tab2, tab3, tab4 = st.tabs(["📈 Real-time Data", "📊 Cell Health", "🔥 Temperature Monitor", "⚡ Historical Trends"])
-    
-    with tab1:
-        st.subheader("Real-time Cell Data")
-        
-        # Create DataFrame for display
-        df = pd.DataFrame(st.session_state.cells_data.values())
-        
-        # Display data table
-        st.dataframe(
-            df[["cell_id", "cell_type", "voltage", "current", "temperature", "power", "capacity", "health", "status"]],
-            use_container_width=True
-        )
-        
-        # Voltage comparison chart
-        fig_voltage = px.bar(
-            df, 
-            x="cell_id", 
-            y="voltage", 
-            color="cell_type",
-            title="Cell Voltage Comparison",
-            color_discrete_map={cell_type: config["color"] for cell_type, config in CELL_CONFIGS.items()}
-        )
-        fig_voltage.add_hline(y=df["min_voltage"].iloc[0], line_dash="dash", line_color="red", annotation_text="Min Voltage")
-        fig_voltage.add_hline(y=df["max_voltage"].iloc[0], line_dash="dash", line_color="red", annotation_text="Max Voltage")
-        st.plotly_chart(fig_voltage, use_container_width=True)
-    
-    with tab2:
-        st.subheader("Cell Health Analysis")
-        
-        # Health gauge charts
-        cols = st.columns(4)
-        for i, (cell_id, cell_data) in enumerate(st.session_state.cells_data.items()):
-            with cols[i % 4]:
-                fig_gauge = go.Figure(go.Indicator(
-                    mode = "gauge+number+delta",
-                    value = cell_data["health"],
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': cell_id},
-                    delta = {'reference': 100},
-                    gauge = {
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [0, 60], 'color': "lightgray"},
-                            {'range': [60, 80], 'color': "yellow"},
-                            {'range': [80, 100], 'color': "lightgreen"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ))
-                fig_gauge.update_layout(height=250)
-                st.plotly_chart(fig_gauge, use_container_width=True)
-        
-        # Health distribution
-        fig_health = px.histogram(
-            df, 
-            x="health", 
-            nbins=10, 
-            title="Health Distribution",
-            color="status",
-            color_discrete_map={"Good": "green", "Warning": "orange", "Critical": "red"}
-        )
-        st.plotly_chart(fig_health, use_container_width=True)
-    
-    with tab3:
-        st.subheader("Temperature Monitoring")
-        
-        # Temperature heatmap
-        temp_data = df.pivot_table(values='temperature', index='cell_type', columns='cell_id', fill_value=0)
-        fig_temp = px.imshow(
-            temp_data, 
-            title="Temperature Heatmap",
-            color_continuous_scale="RdYlBu_r",
-            aspect="auto"
-        )
-        st.plotly_chart(fig_temp, use_container_width=True)
-        
-        # Temperature vs Power scatter
-        fig_scatter = px.scatter(
-            df, 
-            x="temperature", 
-            y="power", 
-            color="cell_type",
-            size="health",
-            title="Temperature vs Power Analysis",
-            hover_data=["cell_id", "voltage", "current"]
-        )
-        st.plotly_chart(fig_scatter, use_container_width=True)
-    
-    with tab4:
-        st.subheader("Historical Trends")
-        
-        if len(st.session_state.historical_data) > 1:
-            # Prepare historical data
-            hist_df = []
-            for record in st.session_state.historical_data[-50:]:  # Last 50 records
-                for cell_id, cell_data in record["data"].items():
-                    hist_df.append({
-                        "timestamp": record["timestamp"],
-                        "cell_id": cell_id,
-                        "voltage": cell_data["voltage"],
-                        "current": cell_data["current"],
-                        "temperature": cell_data["temperature"],
-                        "health": cell_data["health"]
-                    })
-            
-            hist_df = pd.DataFrame(hist_df)
-            
-            # Multi-line charts
-            fig_trends = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=("Voltage Trends", "Current Trends", "Temperature Trends", "Health Trends"),
-                vertical_spacing=0.08
+# Main content area. Runs as a fragment so the periodic refresh reruns only
+# this section; the sidebar, CSS, and page setup are not re-executed.
+@st.fragment(run_every=5 if (auto_refresh and st.session_state.is_monitoring) else None)
+def render_dashboard():
+    if not st.session_state.cells_df.empty:
+
+        # Update data if monitoring
+        if st.session_state.is_monitoring:
+            current_time = datetime.now()
+            st.session_state.cells_df = generate_cells_batch(
+                st.session_state.cells_df["cell_type"].tolist(), current_time
             )
-            
-            # Voltage trends
-            for cell_id in hist_df["cell_id"].unique():
-                cell_hist = hist_df[hist_df["cell_id"] == cell_id]
-                fig_trends.add_trace(
-                    go.Scatter(x=cell_hist["timestamp"], y=cell_hist["voltage"], name=f"{cell_id}_V", line=dict(width=2)),
-                    row=1, col=1
-                )
-            
-            # Current trends
-            for cell_id in hist_df["cell_id"].unique():
-                cell_hist = hist_df[hist_df["cell_id"] == cell_id]
-                fig_trends.add_trace(
-                    go.Scatter(x=cell_hist["timestamp"], y=cell_hist["current"], name=f"{cell_id}_I", showlegend=False),
-                    row=1, col=2
-                )
-            
-            # Temperature trends
-            for cell_id in hist_df["cell_id"].unique():
-                cell_hist = hist_df[hist_df["cell_id"] == cell_id]
-                fig_trends.add_trace(
-                    go.Scatter(x=cell_hist["timestamp"], y=cell_hist["temperature"], name=f"{cell_id}_T", showlegend=False),
-                    row=2, col=1
-                )
-            
-            # Health trends
-            for cell_id in hist_df["cell_id"].unique():
-                cell_hist = hist_df[hist_df["cell_id"] == cell_id]
-                fig_trends.add_trace(
-                    go.Scatter(x=cell_hist["timestamp"], y=cell_hist["health"], name=f"{cell_id}_H", showlegend=False),
-                    row=2, col=2
+
+            # Store historical data; the deque caps it at the last 100 snapshots.
+            # Built from column views: cells_df is replaced wholesale each tick,
+            # so the blocks never alias live data.
+            cells_df = st.session_state.cells_df
+            st.session_state.history_blocks.append(pd.DataFrame({
+                col: cells_df[col].to_numpy()
+                for col in ("timestamp", "cell_id", "voltage", "current", "temperature", "health")
+            }))
+            st.session_state.history_version += 1
+
+        df = st.session_state.cells_df
+
+        # System overview
+        st.header(f"📊 System Overview - {bench_name} (Group {group_num})")
+
+        # Summary metrics
+        total_cells = len(df)
+        status_counts = df["status"].value_counts()
+        good_cells = status_counts["Good"]
+        warning_cells = status_counts["Warning"]
+        critical_cells = status_counts["Critical"]
+        avg_health = df["health"].mean()
+        total_power = df["power"].sum()
+
+        col1, col2, col3, col4, col5, col6 = st.columns(6)
+
+        with col1:
+            st.metric("Total Cells", total_cells)
+        with col2:
+            st.metric("Good Cells", good_cells, delta=None)
+        with col3:
+            st.metric("Warning Cells", warning_cells, delta=None)
+        with col4:
+            st.metric("Critical Cells", critical_cells, delta=None)
+        with col5:
+            st.metric("Avg Health", f"{avg_health:.1f}%")
+        with col6:
+            st.metric("Total Power", f"{total_power:.2f}W")
+
+        # Tabs for different views
+        tab1, tab2, tab3, tab4 = st.tabs(["📈 Real-time Data", "📊 Cell Health", "🔥 Temperature Monitor", "⚡ Historical Trends"])
+
+        with tab1:
+            st.subheader("Real-time Cell Data")
+
+            # Display data table
+            st.dataframe(
+                df[["cell_id", "cell_type", "voltage", "current", "temperature", "power", "capacity", "health", "status"]],
+                use_container_width=True
+            )
+
+            # Voltage comparison chart
+            fig_voltage = px.bar(
+                df, 
+                x="cell_id", 
+                y="voltage", 
+                color="cell_type",
+                title="Cell Voltage Comparison",
+                color_discrete_map=CELL_COLOR_MAP
+            )
+            # One dashed line per voltage bound of each present cell type,
+            # applied as a single layout update rather than repeated add_hline calls
+            shapes = []
+            for cell_type in df["cell_type"].unique():
+                for bound in VOLTAGE_BOUNDS[cell_type]:
+                    shapes.append(dict(
+                        type="line", xref="paper", x0=0, x1=1, y0=bound, y1=bound,
+                        line=dict(dash="dash", color="red", width=1)
+                    ))
+            fig_voltage.update_layout(shapes=shapes)
+            st.plotly_chart(fig_voltage, use_container_width=True)
+
+        with tab2:
+            st.subheader("Cell Health Analysis")
+
+            # Health gauge charts
+            # All gauges live in one subplot figure, built once per cell layout:
+            # a single component mount and payload per refresh instead of one per
+            # cell, with only the indicator values changing between ticks
+            if ('gauges_fig' not in st.session_state
+                    or st.session_state.gauges_cell_ids != df["cell_id"].tolist()):
+                st.session_state.gauges_cell_ids = df["cell_id"].tolist()
+                st.session_state.gauges_fig = build_gauges_figure(st.session_state.gauges_cell_ids)
+
+            fig_gauges = st.session_state.gauges_fig
+            for gauge, cell_health in zip(fig_gauges.data, df["health"]):
+                gauge.value = cell_health
+            st.plotly_chart(fig_gauges, use_container_width=True, key="health_gauges")
+
+            # Health distribution
+            fig_health = px.histogram(
+                df, 
+                x="health", 
+                nbins=10, 
+                title="Health Distribution",
+                color="status",
+                color_discrete_map={"Good": "green", "Warning": "orange", "Critical": "red"}
+            )
+            st.plotly_chart(fig_health, use_container_width=True)
+
+        with tab3:
+            st.subheader("Temperature Monitoring")
+
+            # Temperature heatmap: fill the grid by direct indexing instead of
+            # running pivot_table on every refresh
+            cell_ids = df["cell_id"].tolist()
+            type_labels, type_idx = get_heatmap_layout(tuple(cell_ids), tuple(df["cell_type"]))
+            temp_grid = np.zeros((len(type_labels), len(cell_ids)))
+            temp_grid[type_idx, np.arange(len(cell_ids))] = df["temperature"].to_numpy()
+            fig_temp = px.imshow(
+                temp_grid,
+                x=cell_ids,
+                y=type_labels,
+                title="Temperature Heatmap",
+                color_continuous_scale="RdYlBu_r",
+                aspect="auto"
+            )
+            st.plotly_chart(fig_temp, use_container_width=True)
+
+            # Temperature vs Power scatter
+            fig_scatter = px.scatter(
+                df, 
+                x="temperature", 
+                y="power", 
+                color="cell_type",
+                size="health",
+                title="Temperature vs Power Analysis",
+                hover_data=["cell_id", "voltage", "current"],
+                render_mode="webgl"
+            )
+            st.plotly_chart(fig_scatter, use_container_width=True)
+
+        with tab4:
+            st.subheader("Historical Trends")
+
+            if len(st.session_state.history_blocks) > 1:
+                hist_df = get_history_frame(st.session_state.history_version)
+
+                # Multi-line charts
+                fig_trends = make_subplots(
+                    rows=2, cols=2,
+                    subplot_titles=("Voltage Trends", "Current Trends", "Temperature Trends", "Health Trends"),
+                    vertical_spacing=0.08
                 )
-            
-            fig_trends.update_layout(height=600, title_text="Historical Data Trends")
-            fig_trends.update_xaxes(title_text="Time")
-            fig_trends.update_yaxes(title_text="Voltage (V)", row=1, col=1)
-            fig_trends.update_yaxes(title_text="Current (A)", row=1, col=2)
-            fig_trends.update_yaxes(title_text="Temperature (°C)", row=2, col=1)
-            fig_trends.update_yaxes(title_text="Health (%)", row=2, col=2)
-            
-            st.plotly_chart(fig_trends, use_container_width=True)
-        else:
-            st.info("Start monitoring to see historical trends...")
-
-else:
-    st.info("👈 Please configure and initialize cells using the sidebar to begin monitoring.")
-    
-    # Display sample configuration
-    st.subheader("Sample Cell Types Available:")
-    for cell_type, config in CELL_CONFIGS.items():
-        st.write(f"**{cell_type}**: {config['min_voltage']}V - {config['max_voltage']}V (Nominal: {config['nominal_voltage']}V)")
+
+                # Voltage, current, temperature and health trends: one groupby
+                # pass over the history instead of a boolean mask per cell/metric
+                subplot_metrics = [
+                    (1, 1, "voltage", "V"),
+                    (1, 2, "current", "I"),
+                    (2, 1, "temperature", "T"),
+                    (2, 2, "health", "H")
+                ]
+                for cell_id, cell_hist in hist_df.groupby("cell_id", sort=False):
+                    # Downsample long series so the browser payload stays bounded
+                    if len(cell_hist) > 200:
+                        cell_hist = cell_hist.iloc[::len(cell_hist) // 200]
+                    for row, col, metric, suffix in subplot_metrics:
+                        fig_trends.add_trace(
+                            go.Scattergl(
+                                x=cell_hist["timestamp"],
+                                y=cell_hist[metric],
+                                name=f"{cell_id}_{suffix}",
+                                line=dict(width=2) if metric == "voltage" else None,
+                                showlegend=(metric == "voltage")
+                            ),
+                            row=row, col=col
+                        )
+
+                fig_trends.update_layout(height=600, title_text="Historical Data Trends")
+                fig_trends.update_xaxes(title_text="Time")
+                fig_trends.update_yaxes(title_text="Voltage (V)", row=1, col=1)
+                fig_trends.update_yaxes(title_text="Current (A)", row=1, col=2)
+                fig_trends.update_yaxes(title_text="Temperature (°C)", row=2, col=1)
+                fig_trends.update_yaxes(title_text="Health (%)", row=2, col=2)
+
+                st.plotly_chart(fig_trends, use_container_width=True)
+            else:
+                st.info("Start monitoring to see historical trends...")
+
+    else:
+        st.info("👈 Please configure and initialize cells using the sidebar to begin monitoring.")
+
+        # Display sample configuration
+        st.subheader("Sample Cell Types Available:")
+        for cell_type, config in CELL_CONFIGS.items():
+            st.write(f"**{cell_type}**: {config['min_voltage']}V - {config['max_voltage']}V (Nominal: {config['nominal_voltage']}V)")
+
+render_dashboard()
 
 # Footer
 st.markdown("---")